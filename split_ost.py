@@ -9,112 +9,290 @@ import sys
 import subprocess
 import json
 import re
+import shutil
 import argparse
+import asyncio
+import bisect
+import csv
+import functools
+import hashlib
+import tempfile
 from pathlib import Path
 
-def check_ffmpeg():
-    """Check if FFmpeg is available"""
+# FFmpeg executables, resolved through PATH once at import time
+FFMPEG_BIN = shutil.which('ffmpeg') or 'ffmpeg'
+FFPROBE_BIN = shutil.which('ffprobe') or 'ffprobe'
+
+# Maximum number of output segments written by a single FFmpeg invocation
+FUSED_BATCH_SIZE = 32
+
+# Sample rate the audio is down-mixed and resampled to before silencedetect;
+# detection only needs the signal envelope, so fewer samples means less work
+SILENCE_DETECT_SR = 8000
+
+# Location of cached silence detection results
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'auto-mp3-splitter')
+
+# Bump when the cache file layout changes so old entries are never read
+CACHE_FORMAT_VERSION = 2
+
+# silencedetect log lines, e.g. "[silencedetect @ 0x...] silence_start: 12.345"
+# (a file that opens with silence can report a slightly negative start)
+SILENCE_RE = re.compile(r'silence_(start|end):\s*(-?[\d.]+)')
+
+# FFmpeg -progress lines, e.g. "out_time_us=1234567" or "bitrate= 128.0kbits/s"
+PROGRESS_RE = re.compile(r'^[a-z0-9_]+=')
+
+# Characters that are not allowed in file names on common file systems
+SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
+@functools.lru_cache(maxsize=2)
+def check_ffmpeg(verify=False):
+    """
+    Check if FFmpeg is available (cached for the lifetime of the process)
+    By default this only scans PATH; verify=True also runs 'ffmpeg -version'
+    """
+    if shutil.which(FFMPEG_BIN) is None:
+        return False
+    if not verify:
+        return True
     try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
+        subprocess.run([FFMPEG_BIN, '-version'], capture_output=True, check=True)
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
-def get_audio_info(input_file):
-    """Get audio file information using ffprobe"""
-    try:
+@functools.lru_cache(maxsize=128)
+def _probe_audio_info(input_file, mtime, file_size):
+    """
+    Run ffprobe and extract the relevant fields
+    mtime and file_size are part of the cache key so a changed file is probed again
+    """
+    # Only ask for the fields we use, from the first audio stream
+    cmd = [
+        FFPROBE_BIN, '-v', 'quiet', '-print_format', 'json',
+        '-show_entries', 'format=duration,size:stream=sample_rate,channels,codec_name',
+        '-select_streams', 'a:0', input_file
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    info = json.loads(result.stdout)
+    
+    if info.get('streams'):
+        audio_stream = info['streams'][0]
+    else:
+        # Fall back to the full query if the targeted one came back without streams
         cmd = [
-            'ffprobe', '-v', 'quiet', '-print_format', 'json',
+            FFPROBE_BIN, '-v', 'quiet', '-print_format', 'json',
             '-show_format', '-show_streams', input_file
         ]
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         info = json.loads(result.stdout)
-        
-        # Extract relevant information
-        format_info = info['format']
         audio_stream = next(s for s in info['streams'] if s['codec_type'] == 'audio')
-        
-        duration = float(format_info['duration'])
-        size = int(format_info['size'])
-        
-        return {
-            'duration': duration,
-            'size': size,
-            'sample_rate': int(audio_stream['sample_rate']),
-            'channels': int(audio_stream['channels']),
-            'codec': audio_stream['codec_name']
-        }
+    
+    # Extract relevant information
+    format_info = info['format']
+    
+    duration = float(format_info['duration'])
+    size = int(format_info['size'])
+    
+    return {
+        'duration': duration,
+        'size': size,
+        'sample_rate': int(audio_stream['sample_rate']),
+        'channels': int(audio_stream['channels']),
+        'codec': audio_stream['codec_name']
+    }
+
+def get_audio_info(input_file):
+    """Get audio file information using ffprobe (cached per file version)"""
+    try:
+        st = os.stat(input_file)
+        # Return a copy so callers can't mutate the cached entry
+        return dict(_probe_audio_info(input_file, st.st_mtime, st.st_size))
     except Exception as e:
         print(f"Error getting audio info: {e}")
         return None
 
-def detect_silence_ffmpeg(input_file, silence_thresh=-48, min_silence_duration=1.5):
+def _consistent_silences(silences):
     """
-    Use FFmpeg's silencedetect filter to find silence periods
-    Returns list of (start, end) tuples for non-silent segments
+    Keep only (silence_start, silence_end) pairs that are ordered and non-overlapping
+    Pairs that are reversed or begin before the previous silence ends are dropped
     """
-    print(f"Detecting silence using FFmpeg...")
-    print(f"Threshold: {silence_thresh}dB, Min duration: {min_silence_duration}s")
+    kept = []
+    last_end = 0.0
+    for silence_start, silence_end in silences:
+        if silence_end < silence_start or silence_start < last_end:
+            continue
+        kept.append((silence_start, silence_end))
+        last_end = silence_end
+    return kept
+
+def _build_segments(silences, total_duration, min_track_duration=5.0):
+    """
+    Convert (silence_start, silence_end) pairs into non-silent (start, end) segments
+    Segments shorter than min_track_duration are merged into the preceding one
+    """
+    # Audio runs from the end of each silence to the start of the next one
+    raw_segments = []
+    current_start = 0.0
+    for silence_start, silence_end in _consistent_silences(silences):
+        raw_segments.append((current_start, silence_start))
+        current_start = silence_end
+    raw_segments.append((current_start, total_duration))
+    
+    merged = []
+    for start, end in raw_segments:
+        if end <= start:
+            continue
+        if end - start < min_track_duration and merged:
+            # Absorb the silence before this short segment into the previous track
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    
+    # Drop anything still too short (e.g. a short segment at the very start)
+    return [(start, end) for start, end in merged if end - start >= min_track_duration]
+
+def _silence_cache_path(input_file, silence_thresh, min_silence_duration):
+    """
+    Cache file for silence detection results of this file version and settings
+    """
+    st = os.stat(input_file)
+    key = (f"v{CACHE_FORMAT_VERSION}|{os.path.abspath(input_file)}|{st.st_mtime}|{st.st_size}|"
+           f"{silence_thresh}|{min_silence_duration}|{SILENCE_DETECT_SR}")
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + '.json')
+
+def _load_silence_cache(cache_path):
+    """Load cached silence periods, or return None on a miss or unreadable entry"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
     
-    # FFmpeg silencedetect command
+    def is_number(value):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    
+    # Anything that doesn't look like our format counts as a miss and gets rewritten
+    if not isinstance(cached, dict) or not isinstance(cached.get('silences'), list):
+        return None
+    for pair in cached['silences']:
+        if not (isinstance(pair, list) and len(pair) == 2 and all(map(is_number, pair))):
+            return None
+    total_duration = cached.get('total_duration')
+    if total_duration is not None and not is_number(total_duration):
+        return None
+    return cached
+
+def _save_silence_cache(cache_path, silences, total_duration):
+    """Write silence periods to the cache atomically; failures are not fatal"""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'silences': [list(pair) for pair in silences],
+                'total_duration': total_duration
+            }, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: could not write silence cache: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def _run_silencedetect(input_file, silence_thresh, min_silence_duration):
+    """
+    Run FFmpeg's silencedetect filter
+    Returns a list of (silence_start, silence_end) pairs in stream order
+    """
+    # FFmpeg silencedetect command (stats and banner suppressed to keep stderr small;
+    # silencedetect events are logged at info level)
     cmd = [
-        'ffmpeg', '-i', input_file, '-af', 
+        FFMPEG_BIN, '-nostats', '-hide_banner', '-loglevel', 'info',
+        '-i', input_file, '-af', 
+        f'aformat=channel_layouts=mono,aresample={SILENCE_DETECT_SR},'
         f'silencedetect=noise={silence_thresh}dB:d={min_silence_duration}',
         '-f', 'null', '-'
     ]
     
+    # Parse silence detection output; each end is paired with the start before it
+    silences = []
+    pending_start = None
+    
+    # Stream stderr line by line instead of buffering the whole log
+    # Only ASCII markers are matched, so undecodable bytes (e.g. in echoed tags) are replaced
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True, encoding='utf-8', errors='replace', bufsize=1)
     try:
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        output = result.stderr
-        
-        # Parse silence detection output
-        silence_starts = []
-        silence_ends = []
-        
-        # Find silence start and end times
-        for line in output.split('\n'):
-            if 'silence_start:' in line:
-                match = re.search(r'silence_start: ([\d.]+)', line)
-                if match:
-                    silence_starts.append(float(match.group(1)))
-            elif 'silence_end:' in line:
-                match = re.search(r'silence_end: ([\d.]+)', line)
-                if match:
-                    silence_ends.append(float(match.group(1)))
+        for line in proc.stderr:
+            if 'silence_' not in line:
+                continue
+            match = SILENCE_RE.search(line)
+            if not match:
+                continue
+            timestamp = max(0.0, float(match.group(2)))
+            if match.group(1) == 'start':
+                pending_start = timestamp
+            elif pending_start is not None:
+                silences.append((pending_start, timestamp))
+                pending_start = None
+        proc.wait()
+    finally:
+        proc.stderr.close()
+        # Don't leave FFmpeg decoding in the background if parsing failed
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+    
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    
+    return silences
+
+def detect_silence_ffmpeg(input_file, silence_thresh=-48, min_silence_duration=1.5,
+                          total_duration=None, use_cache=True, min_track_duration=5.0):
+    """
+    Use FFmpeg's silencedetect filter to find silence periods
+    Returns list of (start, end) tuples for non-silent segments
+    total_duration is probed with ffprobe when not supplied by the caller
+    Results are cached on disk per file version and settings unless use_cache is False
+    """
+    print(f"Detecting silence using FFmpeg...")
+    print(f"Threshold: {silence_thresh}dB, Min duration: {min_silence_duration}s")
+    
+    try:
+        cache_path = None
+        cached = None
+        if use_cache:
+            cache_path = _silence_cache_path(input_file, silence_thresh, min_silence_duration)
+            cached = _load_silence_cache(cache_path)
         
-        print(f"Found {len(silence_starts)} silence periods")
+        if cached:
+            print("Using cached silence detection results")
+            silences = [tuple(pair) for pair in cached['silences']]
+            if total_duration is None:
+                total_duration = cached.get('total_duration')
+        else:
+            silences = _run_silencedetect(input_file, silence_thresh, min_silence_duration)
         
-        # Convert silence periods to non-silent segments
-        non_silent_segments = []
+        print(f"Found {len(silences)} silence periods")
         
         # Get total duration
-        info = get_audio_info(input_file)
-        if not info:
-            return []
-        
-        total_duration = info['duration']
-        
-        # Build non-silent segments
-        current_start = 0.0
-        
-        for i in range(len(silence_starts)):
-            if i < len(silence_ends):
-                # Non-silent segment before this silence
-                silence_start = silence_starts[i]
-                silence_end = silence_ends[i]
-                
-                if silence_start > current_start:
-                    non_silent_segments.append((current_start, silence_start))
-                
-                current_start = silence_end
+        if total_duration is None:
+            info = get_audio_info(input_file)
+            if not info:
+                return []
+            
+            total_duration = info['duration']
         
-        # Add final segment if there's audio after the last silence
-        if current_start < total_duration:
-            non_silent_segments.append((current_start, total_duration))
+        if cache_path and not cached:
+            # Only store pairs that can be used as-is, so a bad parse is never reused
+            _save_silence_cache(cache_path, _consistent_silences(silences), total_duration)
         
-        # Filter out very short segments (less than 5 seconds)
-        non_silent_segments = [(start, end) for start, end in non_silent_segments 
-                              if end - start >= 5.0]
+        # Convert silence periods to non-silent segments
+        non_silent_segments = _build_segments(silences, total_duration, min_track_duration)
         
         return non_silent_segments
         
@@ -122,41 +300,234 @@ def detect_silence_ffmpeg(input_file, silence_thresh=-48, min_silence_duration=1
         print(f"Error during silence detection: {e}")
         return []
 
-def split_audio_ffmpeg(input_file, segments, output_dir, base_name):
+async def _extract_one(sem, input_file, start_time, duration, output_path, on_progress):
+    """
+    Extract a single segment with FFmpeg (stream copy, no re-encoding)
+    on_progress is called with the number of seconds written so far
+    """
+    # -ss before -i seeks in the container instead of demuxing up to start_time;
+    # every MP3 frame is independently decodable, so copy mode stays accurate
+    cmd = [
+        FFMPEG_BIN, '-nostats', '-loglevel', 'error', '-progress', 'pipe:2',
+        '-ss', str(start_time),
+        '-i', input_file,
+        '-t', str(duration),
+        '-c', 'copy',  # Copy without re-encoding for speed
+        '-avoid_negative_ts', 'make_zero',
+        '-y',  # Overwrite output files
+        output_path
+    ]
+    
+    async with sem:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE)
+        errors = []
+        try:
+            # -progress writes key=value blocks; anything else is an error message
+            async for raw in proc.stderr:
+                line = raw.decode(errors='replace').strip()
+                if line.startswith('out_time_us='):
+                    value = line[len('out_time_us='):]
+                    if value.isdigit():
+                        on_progress(int(value) / 1_000_000)
+                elif line and not PROGRESS_RE.match(line):
+                    errors.append(line)
+            await proc.wait()
+        except asyncio.CancelledError:
+            proc.kill()
+            await proc.wait()
+            raise
+    
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr='\n'.join(errors))
+
+def _describe_failure(e, max_lines=5):
+    """
+    Short description of a failed FFmpeg run: exit status and the tail of its stderr
+    """
+    stderr = e.stderr or ''
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode('utf-8', errors='replace')
+    tail = stderr.strip().splitlines()[-max_lines:]
+    message = f"exit status {e.returncode}"
+    if tail:
+        message += ": " + " | ".join(line.strip() for line in tail)
+    return message
+
+def _extract_fused(input_file, jobs):
+    """
+    Extract several segments with a single FFmpeg invocation
+    The input is opened and demuxed once; each segment is its own output group
+    """
+    cmd = [FFMPEG_BIN, '-i', input_file]
+    for _, start_time, duration, output_path in jobs:
+        cmd += [
+            '-ss', str(start_time),
+            '-t', str(duration),
+            '-c', 'copy',
+            '-avoid_negative_ts', 'make_zero',
+            '-y',
+            output_path
+        ]
+    subprocess.run(cmd, capture_output=True, check=True)
+
+async def _extract_all(input_file, jobs, workers):
+    """
+    Run per-segment extractions concurrently, at most workers at a time
+    Prints aggregated progress and the outcome of each track
+    """
+    sem = asyncio.Semaphore(workers)
+    total = sum(duration for _, _, duration, _ in jobs) or 1.0
+    done = {}
+    
+    def report():
+        pct = min(100.0, 100.0 * sum(done.values()) / total)
+        print(f"\r  Progress: {pct:5.1f}%", end='', flush=True)
+    
+    async def run(i, start_time, duration, output_path):
+        def on_progress(seconds):
+            done[i] = min(seconds, duration)
+            report()
+        
+        try:
+            await _extract_one(sem, input_file, start_time, duration, output_path, on_progress)
+            done[i] = duration
+            print(f"\r  ✓ Saved track {i+1:2d}: {start_time:.2f}s - {start_time + duration:.2f}s")
+        except subprocess.CalledProcessError as e:
+            print(f"\r  ✗ Error extracting segment {i+1}: {_describe_failure(e)}")
+        report()
+    
+    await asyncio.gather(*(run(*job) for job in jobs))
+    print()
+
+def _extract_parallel(input_file, jobs, workers):
+    """
+    Extract segments concurrently, one FFmpeg process per segment
+    """
+    workers = max(1, min(len(jobs), workers))
+    asyncio.run(_extract_all(input_file, jobs, workers))
+
+def _tracks_are_ordered(jobs):
+    """Check that tracks are non-empty, sorted by start and don't overlap"""
+    last_end = 0.0
+    for _, start_time, duration, _ in jobs:
+        if start_time < last_end or duration <= 0:
+            return False
+        last_end = start_time + duration
+    return True
+
+def _split_segment_muxer(input_file, jobs, output_dir):
+    """
+    Split with FFmpeg's segment muxer: one process, one read of the input
+    The file is cut at every track boundary into a temporary directory, the
+    chunks that cover a track are moved into place and silence gaps discarded
+    Returns the jobs for which no chunk was produced
+    """
+    # Every track start and end is a cut point, so each track is exactly one chunk
+    cut_times = sorted({t for _, start_time, duration, _ in jobs
+                        for t in (start_time, start_time + duration) if t > 0})
+    
+    tmp_dir = tempfile.mkdtemp(prefix='.segments-', dir=output_dir)
+    try:
+        list_path = os.path.join(tmp_dir, 'segments.csv')
+        cmd = [
+            FFMPEG_BIN, '-nostats', '-hide_banner', '-loglevel', 'error',
+            '-i', input_file,
+            '-map', '0:a:0',  # The mp3 muxer takes a single audio stream
+            '-c', 'copy',
+            '-f', 'segment',
+            '-segment_times', ','.join(str(t) for t in cut_times),
+            '-segment_list', list_path,
+            '-segment_list_type', 'csv',
+            '-reset_timestamps', '1',
+            '-y',
+            os.path.join(tmp_dir, 'chunk_%05d.mp3')
+        ]
+        subprocess.run(cmd, capture_output=True, check=True)
+        
+        # Manifest rows are "filename,start,end"; match chunks to tracks by midpoint
+        track_starts = [start_time for _, start_time, _, _ in jobs]
+        remaining = {job[0]: job for job in jobs}
+        with open(list_path, newline='', encoding='utf-8') as f:
+            for name, chunk_start, chunk_end in csv.reader(f):
+                mid = (float(chunk_start) + float(chunk_end)) / 2
+                k = bisect.bisect_right(track_starts, mid) - 1
+                if k < 0:
+                    continue
+                i, start_time, duration, output_path = jobs[k]
+                if i in remaining and mid < start_time + duration:
+                    os.replace(os.path.join(tmp_dir, os.path.basename(name)), output_path)
+                    del remaining[i]
+                    print(f"  ✓ Saved track {i+1:2d}: {start_time:.2f}s - {start_time + duration:.2f}s")
+        
+        return list(remaining.values())
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def _split_legacy(input_file, jobs, workers):
+    """
+    Write segments in batches from a single input read per batch;
+    a batch that fails falls back to parallel per-segment extraction
+    """
+    # Batch outputs to stay well under command line length limits (~32k chars on Windows)
+    for b in range(0, len(jobs), FUSED_BATCH_SIZE):
+        batch = jobs[b:b + FUSED_BATCH_SIZE]
+        try:
+            _extract_fused(input_file, batch)
+            for i, start_time, duration, _ in batch:
+                print(f"  ✓ Saved track {i+1:2d}: {start_time:.2f}s - {start_time + duration:.2f}s")
+        except subprocess.CalledProcessError as e:
+            print(f"  ! Batch extraction failed ({_describe_failure(e)}), "
+                  f"falling back to per-segment extraction")
+            _extract_parallel(input_file, batch, workers)
+
+def split_audio_ffmpeg(input_file, segments, output_dir, base_name, workers=None,
+                       legacy_split=False):
     """
     Split audio file using FFmpeg based on detected segments
+    Uses the segment muxer unless legacy_split is set; tracks it could not
+    produce are extracted with the legacy batched/per-segment path
     """
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
         print(f"Created output directory: {output_dir}")
     
+    if not segments:
+        return
+    
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
     print(f"\nSplitting audio into {len(segments)} segments...")
     
+    jobs = []
     for i, (start_time, end_time) in enumerate(segments):
         duration = end_time - start_time
         output_filename = f"{base_name}_track_{i+1:02d}.mp3"
         output_path = os.path.join(output_dir, output_filename)
-        
-        # FFmpeg command to extract segment
-        cmd = [
-            'ffmpeg', '-i', input_file,
-            '-ss', str(start_time),
-            '-t', str(duration),
-            '-c', 'copy',  # Copy without re-encoding for speed
-            '-avoid_negative_ts', 'make_zero',
-            '-y',  # Overwrite output files
-            output_path
-        ]
-        
+        print(f"Extracting track {i+1:2d}: {output_filename} ({duration:.2f}s)")
+        jobs.append((i, start_time, duration, output_path))
+    
+    # The segment muxer maps chunks back to tracks, which needs ordered, non-overlapping tracks
+    if not legacy_split and not _tracks_are_ordered(jobs):
+        print("  ! Tracks overlap or are out of order, using legacy split")
+    elif not legacy_split:
         try:
-            print(f"Extracting track {i+1:2d}: {output_filename} ({duration:.2f}s)")
-            subprocess.run(cmd, capture_output=True, check=True)
-            print(f"  ✓ Saved: {start_time:.2f}s - {end_time:.2f}s")
-            
+            jobs = _split_segment_muxer(input_file, jobs, output_dir)
         except subprocess.CalledProcessError as e:
-            print(f"  ✗ Error extracting segment {i+1}: {e}")
+            print(f"  ! Segment muxer failed ({_describe_failure(e)}), falling back to legacy split")
+        except (OSError, ValueError) as e:
+            print(f"  ! Segment muxer failed ({e}), falling back to legacy split")
+        else:
+            if jobs:
+                print(f"  ! {len(jobs)} tracks missing from segment muxer output, extracting separately")
+    
+    if jobs:
+        _split_legacy(input_file, jobs, workers)
 
-def split_mp3_file(input_file, output_dir=None, silence_thresh=-48, min_silence_duration=1.5):
+def split_mp3_file(input_file, output_dir=None, silence_thresh=-48, min_silence_duration=1.5,
+                   workers=None, use_cache=True, min_track_duration=5.0,
+                   legacy_split=False):
     """
     Main function to split MP3 file using FFmpeg
     """
@@ -189,17 +560,19 @@ def split_mp3_file(input_file, output_dir=None, silence_thresh=-48, min_silence_
     
     base_name = Path(input_file).stem
     # Clean up base name for file system compatibility
-    base_name = re.sub(r'[<>:"/\\|?*]', '_', base_name)
+    base_name = SANITIZE_RE.sub('_', base_name)
     
     # Detect silence and get segments
-    segments = detect_silence_ffmpeg(input_file, silence_thresh, min_silence_duration)
+    segments = detect_silence_ffmpeg(input_file, silence_thresh, min_silence_duration,
+                                     total_duration=info['duration'], use_cache=use_cache,
+                                     min_track_duration=min_track_duration)
     
     if not segments:
         print("No segments detected. Try adjusting the silence threshold or duration.")
         return False
     
     # Split the audio
-    split_audio_ffmpeg(input_file, segments, output_dir, base_name)
+    split_audio_ffmpeg(input_file, segments, output_dir, base_name, workers, legacy_split)
     
     # Summary
     total_segments_duration = sum(end - start for start, end in segments)
@@ -220,6 +593,16 @@ def main():
                        help="Silence threshold in dB (default: -48)")
     parser.add_argument("-d", "--duration", type=float, default=1.5,
                        help="Minimum silence duration in seconds (default: 1.5)")
+    parser.add_argument("-m", "--min-track-duration", type=float, default=5.0,
+                       help="Minimum track length in seconds; shorter segments are merged "
+                            "into the previous track (default: 5.0)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                       help="Number of parallel FFmpeg extractions, used only when both the segment "
+                            "muxer and batch extraction fail (default: CPU count)")
+    parser.add_argument("--legacy-split", action="store_true",
+                       help="Extract tracks with per-track output groups instead of the segment muxer")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Ignore and don't write cached silence detection results")
     
     args = parser.parse_args()
     
@@ -231,7 +614,11 @@ def main():
         args.input_file,
         args.output,
         args.threshold,
-        args.duration
+        args.duration,
+        args.workers,
+        not args.no_cache,
+        args.min_track_duration,
+        args.legacy_split
     )
     
     if not success: